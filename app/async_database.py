@@ -0,0 +1,54 @@
+"""Async engine/session for API_MODE=async - needs the aiosqlite driver"""
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
+from sqlalchemy.pool import AsyncAdaptedQueuePool
+from app.config import (
+    DATABASE_PATH,
+    DB_WRITE_POOL_SIZE,
+    DB_WRITE_MAX_OVERFLOW,
+    DB_READ_POOL_SIZE,
+    DB_READ_MAX_OVERFLOW,
+    DB_POOL_TIMEOUT,
+)
+from app.database import install_sqlite_pragmas, sqlite_pragmas
+
+ASYNC_DATABASE_URL = f"sqlite+aiosqlite:///{DATABASE_PATH}"
+
+
+def create_async_sqlite_engine(
+    url: str = ASYNC_DATABASE_URL,
+    read_only: bool = False,
+    pool_size: int = DB_WRITE_POOL_SIZE,
+    max_overflow: int = DB_WRITE_MAX_OVERFLOW,
+):
+    """Async counterpart of create_sqlite_engine - same profile pragmas"""
+    new_engine = create_async_engine(
+        url,
+        poolclass=AsyncAdaptedQueuePool,
+        pool_size=pool_size,
+        max_overflow=max_overflow,
+        pool_timeout=DB_POOL_TIMEOUT,
+    )
+    install_sqlite_pragmas(new_engine.sync_engine, sqlite_pragmas(read_only=read_only))
+    return new_engine
+
+
+async_engine = create_async_sqlite_engine()
+async_read_engine = create_async_sqlite_engine(
+    read_only=True,
+    pool_size=DB_READ_POOL_SIZE,
+    max_overflow=DB_READ_MAX_OVERFLOW,
+)
+
+# expire_on_commit=False - attribute access after commit must not trigger lazy IO
+AsyncSessionLocal = async_sessionmaker(async_engine, class_=AsyncSession, expire_on_commit=False)
+AsyncReadSessionLocal = async_sessionmaker(async_read_engine, class_=AsyncSession, expire_on_commit=False)
+
+
+async def get_async_db():
+    async with AsyncSessionLocal() as db:
+        yield db
+
+
+async def get_async_read_db():
+    async with AsyncReadSessionLocal() as db:
+        yield db
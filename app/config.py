@@ -5,3 +5,33 @@ load_dotenv()
 
 JWT_SECRET = os.getenv("JWT_SECRET", "dev-secret")
 DATABASE_PATH = os.getenv("DATABASE_PATH", "orders.db")
+
+# Upper bound on how many orders a single POST /orders/batch may carry
+ORDER_BATCH_MAX_SIZE = int(os.getenv("ORDER_BATCH_MAX_SIZE", "1000"))
+
+# GET /orders page size - default and hard cap
+ORDERS_PAGE_DEFAULT_LIMIT = int(os.getenv("ORDERS_PAGE_DEFAULT_LIMIT", "50"))
+ORDERS_PAGE_MAX_LIMIT = int(os.getenv("ORDERS_PAGE_MAX_LIMIT", "200"))
+
+# Max rows a background job moves per UPDATE/transaction
+JOB_CHUNK_SIZE = int(os.getenv("JOB_CHUNK_SIZE", "500"))
+
+# SQLite engine profile: "tuned" (WAL + pragmas below) or "default" (stock SQLite settings)
+SQLITE_PROFILE = os.getenv("SQLITE_PROFILE", "tuned")
+SQLITE_JOURNAL_MODE = os.getenv("SQLITE_JOURNAL_MODE", "WAL")
+SQLITE_SYNCHRONOUS = os.getenv("SQLITE_SYNCHRONOUS", "NORMAL")
+SQLITE_BUSY_TIMEOUT_MS = int(os.getenv("SQLITE_BUSY_TIMEOUT_MS", "5000"))
+SQLITE_MMAP_SIZE = int(os.getenv("SQLITE_MMAP_SIZE", str(256 * 1024 * 1024)))
+# Negative = size in KiB (SQLite convention), so -65536 is 64MB per connection
+SQLITE_CACHE_SIZE = int(os.getenv("SQLITE_CACHE_SIZE", "-65536"))
+SQLITE_TEMP_STORE = os.getenv("SQLITE_TEMP_STORE", "MEMORY")
+
+# Connection pools - SQLite has one writer, so the write pool stays small
+DB_WRITE_POOL_SIZE = int(os.getenv("DB_WRITE_POOL_SIZE", "5"))
+DB_WRITE_MAX_OVERFLOW = int(os.getenv("DB_WRITE_MAX_OVERFLOW", "5"))
+DB_READ_POOL_SIZE = int(os.getenv("DB_READ_POOL_SIZE", "10"))
+DB_READ_MAX_OVERFLOW = int(os.getenv("DB_READ_MAX_OVERFLOW", "10"))
+DB_POOL_TIMEOUT = int(os.getenv("DB_POOL_TIMEOUT", "30"))
+
+# Request path: "sync" (def routes on the threadpool) or "async" (AsyncSession over aiosqlite)
+API_MODE = os.getenv("API_MODE", "sync")
@@ -2,20 +2,91 @@ import os
 from sqlalchemy import create_engine, event, text
 from sqlalchemy.ext.declarative import declarative_base
 from sqlalchemy.orm import sessionmaker
-from app.config import DATABASE_PATH
+from app.config import (
+    DATABASE_PATH,
+    SQLITE_PROFILE,
+    SQLITE_JOURNAL_MODE,
+    SQLITE_SYNCHRONOUS,
+    SQLITE_BUSY_TIMEOUT_MS,
+    SQLITE_MMAP_SIZE,
+    SQLITE_CACHE_SIZE,
+    SQLITE_TEMP_STORE,
+    DB_WRITE_POOL_SIZE,
+    DB_WRITE_MAX_OVERFLOW,
+    DB_READ_POOL_SIZE,
+    DB_READ_MAX_OVERFLOW,
+    DB_POOL_TIMEOUT,
+)
 
 DATABASE_URL = f"sqlite:///{DATABASE_PATH}"
 
-engine = create_engine(DATABASE_URL, connect_args={"check_same_thread": False})
 
-# Enable foreign keys for SQLite
-@event.listens_for(engine, "connect")
-def set_sqlite_pragma(dbapi_conn, connection_record):
-    cursor = dbapi_conn.cursor()
-    cursor.execute("PRAGMA foreign_keys=ON")
-    cursor.close()
+def sqlite_pragmas(profile: str = SQLITE_PROFILE, read_only: bool = False) -> list:
+    """PRAGMA statements run on every new connection for the given profile"""
+    pragmas = ["PRAGMA foreign_keys=ON"]
+
+    if profile == "tuned":
+        # journal_mode is a property of the DB file - only the writer sets it
+        if not read_only:
+            pragmas.append(f"PRAGMA journal_mode={SQLITE_JOURNAL_MODE}")
+        pragmas += [
+            f"PRAGMA synchronous={SQLITE_SYNCHRONOUS}",
+            f"PRAGMA busy_timeout={SQLITE_BUSY_TIMEOUT_MS}",
+            f"PRAGMA mmap_size={SQLITE_MMAP_SIZE}",
+            f"PRAGMA cache_size={SQLITE_CACHE_SIZE}",
+            f"PRAGMA temp_store={SQLITE_TEMP_STORE}",
+        ]
+    elif profile != "default":
+        raise ValueError(f"Unknown SQLITE_PROFILE: {profile}")
+
+    if read_only:
+        # Any write through the read engine fails instead of taking the write lock
+        pragmas.append("PRAGMA query_only=ON")
+
+    return pragmas
+
+
+def create_sqlite_engine(
+    url: str = DATABASE_URL,
+    profile: str = SQLITE_PROFILE,
+    read_only: bool = False,
+    pool_size: int = DB_WRITE_POOL_SIZE,
+    max_overflow: int = DB_WRITE_MAX_OVERFLOW,
+):
+    """Create a pooled SQLite engine with the profile's pragmas applied per connection"""
+    new_engine = create_engine(
+        url,
+        connect_args={"check_same_thread": False},
+        pool_size=pool_size,
+        max_overflow=max_overflow,
+        pool_timeout=DB_POOL_TIMEOUT,
+    )
+    install_sqlite_pragmas(new_engine, sqlite_pragmas(profile, read_only))
+    return new_engine
+
+
+def install_sqlite_pragmas(sync_engine, pragmas: list):
+    """Run the given PRAGMAs on every new DBAPI connection of the engine"""
+    @event.listens_for(sync_engine, "connect")
+    def set_sqlite_pragma(dbapi_conn, connection_record):
+        cursor = dbapi_conn.cursor()
+        for pragma in pragmas:
+            cursor.execute(pragma)
+        cursor.close()
+
+
+# Write engine - every mutation and the scheduler jobs go through here
+engine = create_sqlite_engine()
+
+# Read-only engine for GET routes, so reads never queue behind the writer's pool
+read_engine = create_sqlite_engine(
+    read_only=True,
+    pool_size=DB_READ_POOL_SIZE,
+    max_overflow=DB_READ_MAX_OVERFLOW,
+)
 
 SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
+ReadSessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=read_engine)
 
 Base = declarative_base()
 
@@ -28,6 +99,14 @@ def get_db():
         db.close()
 
 
+def get_read_db():
+    db = ReadSessionLocal()
+    try:
+        yield db
+    finally:
+        db.close()
+
+
 def init_db():
     migration_path = os.path.join(os.path.dirname(__file__), "..", "migrations", "init.sql")
     with open(migration_path, 'r') as f:
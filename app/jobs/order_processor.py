@@ -1,67 +1,100 @@
+import time
 from datetime import datetime, timedelta
+from sqlalchemy import select, update
 from sqlalchemy.orm import Session
+from app.config import JOB_CHUNK_SIZE
 from app.database import SessionLocal
 from app.models import Order
 from app.logging_config import logger
 
 
-def process_pending_orders():
+def transition_orders(job_name: str, from_status: str, to_status: str, time_column, cutoff_time: datetime) -> int:
+    """
+    Move orders from one status to another with set-based UPDATEs
+
+    Works in chunks of JOB_CHUNK_SIZE rows, each in its own short transaction,
+    so a big backlog neither loads into memory nor holds the SQLite write lock
+    for the whole run. Returns the number of rows moved.
+    """
+    total_moved = 0
+    chunk_times = []
+
+    while True:
+        db: Session = SessionLocal()
+        try:
+            started = time.perf_counter()
+
+            # No ORDER BY: the (status, time) index already yields oldest first,
+            # and the id comes straight out of the index without a table lookup
+            chunk_ids = (
+                select(Order.id)
+                .where(Order.status == from_status, time_column <= cutoff_time)
+                .limit(JOB_CHUNK_SIZE)
+                .scalar_subquery()
+            )
+            # Re-check status in the UPDATE so a concurrent cancel is never overwritten
+            result = db.execute(
+                update(Order)
+                .where(Order.id.in_(chunk_ids), Order.status == from_status)
+                .values(status=to_status, updated_at=datetime.utcnow())
+                .execution_options(synchronize_session=False)
+            )
+            db.commit()
+            moved = result.rowcount
+        except Exception:
+            db.rollback()
+            raise
+        finally:
+            db.close()
+
+        if moved == 0:
+            break
+
+        elapsed_ms = (time.perf_counter() - started) * 1000
+        chunk_times.append(elapsed_ms)
+        total_moved += moved
+        logger.debug(f"{job_name}: chunk {len(chunk_times)} moved {moved} rows in {elapsed_ms:.1f}ms")
+
+        if moved < JOB_CHUNK_SIZE:
+            break
+
+    if total_moved > 0:
+        logger.info(
+            f"{job_name}: moved {total_moved} orders {from_status} -> {to_status} "
+            f"in {len(chunk_times)} chunks (avg {sum(chunk_times) / len(chunk_times):.1f}ms, "
+            f"max {max(chunk_times):.1f}ms per chunk)"
+        )
+
+    return total_moved
+
+
+def process_pending_orders() -> int:
     """
     Background job to process pending orders
     Simulates order processing by moving pending orders to processing status
     """
-    db: Session = SessionLocal()
     try:
         # Find orders that are pending for more than 1 minute
         cutoff_time = datetime.utcnow() - timedelta(minutes=1)
-
-        pending_orders = db.query(Order).filter(
-            Order.status == "pending",
-            Order.created_at <= cutoff_time
-        ).all()
-
-        processed_count = 0
-        for order in pending_orders:
-            order.status = "processing"
-            processed_count += 1
-
-        if processed_count > 0:
-            db.commit()
-            logger.info(f"Processed {processed_count} pending orders")
-
+        return transition_orders(
+            "process_pending_orders", "pending", "processing", Order.created_at, cutoff_time
+        )
     except Exception as e:
         logger.error(f"Error processing orders: {e}")
-        db.rollback()
-    finally:
-        db.close()
+        return 0
 
 
-def complete_processing_orders():
+def complete_processing_orders() -> int:
     """
     Move processing orders to completed status
     Simulates completion after processing
     """
-    db: Session = SessionLocal()
     try:
         # Orders that have been processing for more than 2 minutes
         cutoff_time = datetime.utcnow() - timedelta(minutes=2)
-
-        processing_orders = db.query(Order).filter(
-            Order.status == "processing",
-            Order.updated_at <= cutoff_time
-        ).all()
-
-        completed_count = 0
-        for order in processing_orders:
-            order.status = "completed"
-            completed_count += 1
-
-        if completed_count > 0:
-            db.commit()
-            logger.info(f"Completed {completed_count} processing orders")
-
+        return transition_orders(
+            "complete_processing_orders", "processing", "completed", Order.updated_at, cutoff_time
+        )
     except Exception as e:
         logger.error(f"Error completing orders: {e}")
-        db.rollback()
-    finally:
-        db.close()
+        return 0
@@ -2,8 +2,7 @@ from fastapi import FastAPI
 from contextlib import asynccontextmanager
 from sqlalchemy.exc import SQLAlchemyError
 from jose import JWTError
-from app.auth.router import router as auth_router
-from app.orders.router import router as orders_router
+from app.config import API_MODE
 from app.scheduler import start_scheduler, stop_scheduler
 from app.exceptions import (
     sqlalchemy_exception_handler,
@@ -34,5 +33,13 @@ def health_check():
     return {"status": "healthy", "message": "API is running"}
 
 
+if API_MODE == "async":
+    # Imported lazily so the sync mode doesn't need aiosqlite installed
+    from app.auth.async_router import router as auth_router
+    from app.orders.async_router import router as orders_router
+else:
+    from app.auth.router import router as auth_router
+    from app.orders.router import router as orders_router
+
 app.include_router(auth_router)
 app.include_router(orders_router)
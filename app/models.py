@@ -1,5 +1,5 @@
 from datetime import datetime
-from sqlalchemy import Column, Integer, String, DateTime, Float, ForeignKey
+from sqlalchemy import Column, Integer, String, DateTime, Float, ForeignKey, Index
 from sqlalchemy.orm import relationship
 from app.database import Base
 
@@ -32,3 +32,13 @@ class Order(Base):
 
     # relationship to user
     user = relationship("User", back_populates="orders")
+
+    __table_args__ = (
+        Index("idx_orders_user_id", "user_id"),
+        Index("idx_orders_status", "status"),
+        # user's orders filtered by status, walked in id order (rowid is implicit)
+        Index("idx_orders_user_status", "user_id", "status"),
+        # scheduler job scans: pending by created_at, processing by updated_at
+        Index("idx_orders_status_created", "status", "created_at"),
+        Index("idx_orders_status_updated", "status", "updated_at"),
+    )
@@ -0,0 +1,166 @@
+from datetime import datetime
+from fastapi import APIRouter, Depends, HTTPException, Query, Response, status
+from sqlalchemy import insert, select
+from sqlalchemy.ext.asyncio import AsyncSession
+from typing import List, Optional
+from app.config import ORDERS_PAGE_DEFAULT_LIMIT, ORDERS_PAGE_MAX_LIMIT
+from app.async_database import get_async_db, get_async_read_db
+from app.models import Order, User
+from app.schemas import OrderCreate, OrderBatchCreate, OrderUpdate, OrderResponse
+from app.auth.async_dependencies import get_current_user_async
+from app.orders.utils import orders_page_query, split_page, batch_order_rows, apply_order_update
+
+router = APIRouter(prefix="/orders", tags=["Orders"])
+
+
+@router.post("/", response_model=OrderResponse, status_code=status.HTTP_201_CREATED)
+async def create_order(
+    order_data: OrderCreate,
+    current_user: User = Depends(get_current_user_async),
+    db: AsyncSession = Depends(get_async_db)
+):
+    """Create a new order for the authenticated user"""
+    new_order = Order(
+        user_id=current_user.id,
+        item_name=order_data.item_name,
+        quantity=order_data.quantity,
+        price=order_data.price,
+        status="pending"
+    )
+
+    db.add(new_order)
+    await db.commit()
+    await db.refresh(new_order)
+
+    return new_order
+
+
+@router.post("/batch", response_model=List[OrderResponse], status_code=status.HTTP_201_CREATED)
+async def create_orders_batch(
+    batch: OrderBatchCreate,
+    current_user: User = Depends(get_current_user_async),
+    db: AsyncSession = Depends(get_async_db)
+):
+    """Create many orders in one transaction - all or nothing"""
+    rows = batch_order_rows(current_user.id, batch)
+
+    result = await db.scalars(insert(Order).returning(Order, sort_by_parameter_order=True), rows)
+    created = result.all()
+    await db.commit()
+
+    return created
+
+
+@router.get("/", response_model=List[OrderResponse])
+async def get_my_orders(
+    response: Response,
+    cursor: Optional[int] = Query(None, description="X-Next-Cursor value from the previous page"),
+    limit: int = Query(ORDERS_PAGE_DEFAULT_LIMIT, ge=1, le=ORDERS_PAGE_MAX_LIMIT),
+    status_filter: Optional[str] = Query(None, alias="status"),
+    created_from: Optional[datetime] = None,
+    created_to: Optional[datetime] = None,
+    sort: str = Query("asc", pattern="^(asc|desc)$"),
+    current_user: User = Depends(get_current_user_async),
+    db: AsyncSession = Depends(get_async_read_db)
+):
+    """Get one page of the authenticated user's orders"""
+    result = await db.scalars(orders_page_query(
+        current_user.id, cursor, limit, status_filter, created_from, created_to, sort
+    ))
+
+    orders, next_cursor = split_page(result.all(), limit)
+    if next_cursor is not None:
+        response.headers["X-Next-Cursor"] = str(next_cursor)
+
+    return orders
+
+
+@router.get("/{order_id}", response_model=OrderResponse)
+async def get_order(
+    order_id: int,
+    current_user: User = Depends(get_current_user_async),
+    db: AsyncSession = Depends(get_async_read_db)
+):
+    """Get a specific order by ID"""
+    order = await db.scalar(select(Order).where(Order.id == order_id))
+
+    if not order:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="Order not found"
+        )
+
+    # Make sure user can only access their own orders
+    if order.user_id != current_user.id:
+        raise HTTPException(
+            status_code=status.HTTP_403_FORBIDDEN,
+            detail="Not authorized to access this order"
+        )
+
+    return order
+
+
+@router.patch("/{order_id}", response_model=OrderResponse)
+async def update_order(
+    order_id: int,
+    order_data: OrderUpdate,
+    current_user: User = Depends(get_current_user_async),
+    db: AsyncSession = Depends(get_async_db)
+):
+    """Update an existing order"""
+    order = await db.scalar(select(Order).where(Order.id == order_id))
+
+    if not order:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="Order not found"
+        )
+
+    if order.user_id != current_user.id:
+        raise HTTPException(
+            status_code=status.HTTP_403_FORBIDDEN,
+            detail="Not authorized to modify this order"
+        )
+
+    # Update fields if provided
+    apply_order_update(order, order_data)
+
+    await db.commit()
+    await db.refresh(order)
+
+    return order
+
+
+@router.delete("/{order_id}/cancel", response_model=OrderResponse)
+async def cancel_order(
+    order_id: int,
+    current_user: User = Depends(get_current_user_async),
+    db: AsyncSession = Depends(get_async_db)
+):
+    """Cancel an order - sets status to cancelled"""
+    order = await db.scalar(select(Order).where(Order.id == order_id))
+
+    if not order:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="Order not found"
+        )
+
+    if order.user_id != current_user.id:
+        raise HTTPException(
+            status_code=status.HTTP_403_FORBIDDEN,
+            detail="Not authorized to cancel this order"
+        )
+
+    # Can only cancel pending or processing orders
+    if order.status in ["completed", "cancelled"]:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=f"Cannot cancel order with status: {order.status}"
+        )
+
+    order.status = "cancelled"
+    await db.commit()
+    await db.refresh(order)
+
+    return order
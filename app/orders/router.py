@@ -1,10 +1,14 @@
-from fastapi import APIRouter, Depends, HTTPException, status
+from datetime import datetime
+from fastapi import APIRouter, Depends, HTTPException, Query, Response, status
+from sqlalchemy import insert
 from sqlalchemy.orm import Session
-from typing import List
-from app.database import get_db
+from typing import List, Optional
+from app.config import ORDERS_PAGE_DEFAULT_LIMIT, ORDERS_PAGE_MAX_LIMIT
+from app.database import get_db, get_read_db
 from app.models import Order, User
-from app.schemas import OrderCreate, OrderUpdate, OrderResponse
+from app.schemas import OrderCreate, OrderBatchCreate, OrderUpdate, OrderResponse
 from app.auth.dependencies import get_current_user
+from app.orders.utils import orders_page_query, split_page, batch_order_rows, apply_order_update
 
 router = APIRouter(prefix="/orders", tags=["Orders"])
 
@@ -31,13 +35,51 @@ def create_order(
     return new_order
 
 
+@router.post("/batch", response_model=List[OrderResponse], status_code=status.HTTP_201_CREATED)
+def create_orders_batch(
+    batch: OrderBatchCreate,
+    current_user: User = Depends(get_current_user),
+    db: Session = Depends(get_db)
+):
+    """Create many orders in one transaction - all or nothing"""
+    rows = batch_order_rows(current_user.id, batch)
+
+    # One multi-row INSERT ... RETURNING instead of an add/commit/refresh per order
+    created = db.scalars(insert(Order).returning(Order, sort_by_parameter_order=True), rows).all()
+
+    # Serialize before commit - commit expires the objects and would reload each one
+    response = [OrderResponse.model_validate(order) for order in created]
+    db.commit()
+
+    return response
+
+
 @router.get("/", response_model=List[OrderResponse])
 def get_my_orders(
+    response: Response,
+    cursor: Optional[int] = Query(None, description="X-Next-Cursor value from the previous page"),
+    limit: int = Query(ORDERS_PAGE_DEFAULT_LIMIT, ge=1, le=ORDERS_PAGE_MAX_LIMIT),
+    status_filter: Optional[str] = Query(None, alias="status"),
+    created_from: Optional[datetime] = None,
+    created_to: Optional[datetime] = None,
+    sort: str = Query("asc", pattern="^(asc|desc)$"),
     current_user: User = Depends(get_current_user),
-    db: Session = Depends(get_db)
+    db: Session = Depends(get_read_db)
 ):
-    """Get all orders for the authenticated user"""
-    orders = db.query(Order).filter(Order.user_id == current_user.id).all()
+    """Get one page of the authenticated user's orders
+
+    Keyset pagination on id: the cursor is the last id already seen, so a deep
+    page costs the same as the first one (no OFFSET scan). When more rows are
+    available the next cursor is returned in the X-Next-Cursor header.
+    """
+    orders = db.scalars(orders_page_query(
+        current_user.id, cursor, limit, status_filter, created_from, created_to, sort
+    )).all()
+
+    orders, next_cursor = split_page(orders, limit)
+    if next_cursor is not None:
+        response.headers["X-Next-Cursor"] = str(next_cursor)
+
     return orders
 
 
@@ -45,7 +87,7 @@ def get_my_orders(
 def get_order(
     order_id: int,
     current_user: User = Depends(get_current_user),
-    db: Session = Depends(get_db)
+    db: Session = Depends(get_read_db)
 ):
     """Get a specific order by ID"""
     order = db.query(Order).filter(Order.id == order_id).first()
@@ -89,14 +131,7 @@ def update_order(
         )
 
     # Update fields if provided
-    if order_data.item_name is not None:
-        order.item_name = order_data.item_name
-    if order_data.quantity is not None:
-        order.quantity = order_data.quantity
-    if order_data.price is not None:
-        order.price = order_data.price
-    if order_data.status is not None:
-        order.status = order_data.status
+    apply_order_update(order, order_data)
 
     db.commit()
     db.refresh(order)
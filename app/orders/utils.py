@@ -0,0 +1,75 @@
+from datetime import datetime
+from typing import List, Optional, Tuple
+from sqlalchemy import select
+from app.models import Order
+from app.schemas import OrderBatchCreate, OrderUpdate
+
+
+def orders_page_query(
+    user_id: int,
+    cursor: Optional[int],
+    limit: int,
+    status_filter: Optional[str] = None,
+    created_from: Optional[datetime] = None,
+    created_to: Optional[datetime] = None,
+    sort: str = "asc",
+):
+    """
+    Build the keyset-paginated SELECT for a user's orders
+
+    Asks for limit + 1 rows so split_page can tell whether another page exists.
+    Plain select() so the sync and async routes share it.
+    """
+    query = select(Order).where(Order.user_id == user_id)
+
+    if status_filter is not None:
+        query = query.where(Order.status == status_filter)
+    if created_from is not None:
+        query = query.where(Order.created_at >= created_from)
+    if created_to is not None:
+        query = query.where(Order.created_at < created_to)
+
+    if sort == "asc":
+        if cursor is not None:
+            query = query.where(Order.id > cursor)
+        query = query.order_by(Order.id.asc())
+    else:
+        if cursor is not None:
+            query = query.where(Order.id < cursor)
+        query = query.order_by(Order.id.desc())
+
+    return query.limit(limit + 1)
+
+
+def split_page(orders: list, limit: int) -> Tuple[list, Optional[int]]:
+    """Trim the extra row fetched by orders_page_query and return the next cursor"""
+    if len(orders) > limit:
+        orders = orders[:limit]
+        return orders, orders[-1].id
+    return orders, None
+
+
+def batch_order_rows(user_id: int, batch: OrderBatchCreate) -> List[dict]:
+    """Parameter rows for a bulk INSERT of a validated batch"""
+    return [
+        {
+            "user_id": user_id,
+            "item_name": item.item_name,
+            "quantity": item.quantity,
+            "price": item.price,
+            "status": "pending",
+        }
+        for item in batch.orders
+    ]
+
+
+def apply_order_update(order: Order, order_data: OrderUpdate):
+    """Copy the fields that were provided onto the order"""
+    if order_data.item_name is not None:
+        order.item_name = order_data.item_name
+    if order_data.quantity is not None:
+        order.quantity = order_data.quantity
+    if order_data.price is not None:
+        order.price = order_data.price
+    if order_data.status is not None:
+        order.status = order_data.status
@@ -1,6 +1,7 @@
 from pydantic import BaseModel, EmailStr, Field
 from datetime import datetime
-from typing import Optional
+from typing import List, Optional
+from app.config import ORDER_BATCH_MAX_SIZE
 
 
 class UserCreate(BaseModel):
@@ -35,6 +36,11 @@ class OrderCreate(BaseModel):
     price: float = Field(..., gt=0)
 
 
+class OrderBatchCreate(BaseModel):
+    # Each item is validated on its own, so a 422 points at the exact index
+    orders: List[OrderCreate] = Field(..., min_length=1, max_length=ORDER_BATCH_MAX_SIZE)
+
+
 class OrderUpdate(BaseModel):
     item_name: Optional[str] = Field(None, min_length=1, max_length=200)
     quantity: Optional[int] = Field(None, gt=0)
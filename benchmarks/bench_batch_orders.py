@@ -0,0 +1,76 @@
+"""Compare N single POST /orders calls against one POST /orders/batch
+
+Run from the repo root:
+    python -m benchmarks.bench_batch_orders --orders 500
+"""
+import argparse
+import os
+import tempfile
+import time
+
+from fastapi.testclient import TestClient
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+
+from app.main import app
+from app.database import Base, get_db
+
+
+def make_client(db_path: str) -> TestClient:
+    """App client bound to a fresh file-backed SQLite DB (real commits/fsyncs)"""
+    engine = create_engine(f"sqlite:///{db_path}", connect_args={"check_same_thread": False})
+    Base.metadata.create_all(bind=engine)
+    SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
+
+    def override_get_db():
+        db = SessionLocal()
+        try:
+            yield db
+        finally:
+            db.close()
+
+    app.dependency_overrides[get_db] = override_get_db
+    return TestClient(app)
+
+
+def auth_headers(client: TestClient) -> dict:
+    creds = {"name": "Bench", "email": "bench@example.com", "password": "benchpass"}
+    client.post("/auth/register", json=creds)
+    token = client.post("/auth/login", json=creds).json()["access_token"]
+    return {"Authorization": f"Bearer {token}"}
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--orders", type=int, default=500)
+    args = parser.parse_args()
+
+    items = [
+        {"item_name": f"Item {i}", "quantity": 1 + i % 5, "price": 9.99}
+        for i in range(args.orders)
+    ]
+
+    with tempfile.TemporaryDirectory() as tmp:
+        client = make_client(os.path.join(tmp, "single.db"))
+        headers = auth_headers(client)
+        start = time.perf_counter()
+        for item in items:
+            client.post("/orders/", headers=headers, json=item)
+        single = time.perf_counter() - start
+
+        client = make_client(os.path.join(tmp, "batch.db"))
+        headers = auth_headers(client)
+        start = time.perf_counter()
+        response = client.post("/orders/batch", headers=headers, json={"orders": items})
+        batch = time.perf_counter() - start
+        assert response.status_code == 201, response.text
+
+    app.dependency_overrides.clear()
+
+    print(f"{args.orders} single calls: {single:.3f}s ({args.orders / single:.0f} orders/s)")
+    print(f"1 batch call:       {batch:.3f}s ({args.orders / batch:.0f} orders/s)")
+    print(f"speedup:            {single / batch:.1f}x")
+
+
+if __name__ == "__main__":
+    main()
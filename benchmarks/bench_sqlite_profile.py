@@ -0,0 +1,114 @@
+"""Mixed read/write throughput for the "default" vs "tuned" SQLite profiles
+
+Readers page through a user's orders on the read engine while writers insert
+orders on the write engine, all on threads against one file DB.
+
+Run from the repo root:
+    python -m benchmarks.bench_sqlite_profile --readers 8 --writers 2 --seconds 5
+"""
+import argparse
+import os
+import tempfile
+import threading
+import time
+
+from sqlalchemy import insert, select
+from sqlalchemy.exc import OperationalError
+from sqlalchemy.orm import sessionmaker
+
+from app.database import Base, create_sqlite_engine
+from app.models import Order, User
+
+
+def run_profile(profile: str, db_path: str, readers: int, writers: int, seconds: float) -> dict:
+    url = f"sqlite:///{db_path}"
+    write_engine = create_sqlite_engine(url, profile=profile, pool_size=writers, max_overflow=0)
+    read_engine = create_sqlite_engine(
+        url, profile=profile, read_only=True, pool_size=readers, max_overflow=0
+    )
+    Base.metadata.create_all(bind=write_engine)
+
+    WriteSession = sessionmaker(bind=write_engine)
+    ReadSession = sessionmaker(bind=read_engine)
+
+    with WriteSession() as db:
+        db.add(User(name="Bench", email="bench@example.com", password_hash="x"))
+        db.commit()
+        db.execute(insert(Order), [
+            {"user_id": 1, "item_name": f"Seed {i}", "quantity": 1, "price": 1.0}
+            for i in range(5000)
+        ])
+        db.commit()
+
+    counts = {"reads": 0, "writes": 0, "errors": 0}
+    lock = threading.Lock()
+    deadline = time.perf_counter() + seconds
+
+    def reader():
+        done = errors = 0
+        while time.perf_counter() < deadline:
+            try:
+                with ReadSession() as db:
+                    db.execute(
+                        select(Order).where(Order.user_id == 1).order_by(Order.id.desc()).limit(50)
+                    ).all()
+                done += 1
+            except OperationalError:
+                errors += 1
+        with lock:
+            counts["reads"] += done
+            counts["errors"] += errors
+
+    def writer():
+        done = errors = 0
+        while time.perf_counter() < deadline:
+            try:
+                with WriteSession() as db:
+                    db.add(Order(user_id=1, item_name="Bench", quantity=1, price=1.0))
+                    db.commit()
+                done += 1
+            except OperationalError:
+                errors += 1
+        with lock:
+            counts["writes"] += done
+            counts["errors"] += errors
+
+    threads = [threading.Thread(target=reader) for _ in range(readers)]
+    threads += [threading.Thread(target=writer) for _ in range(writers)]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+
+    write_engine.dispose()
+    read_engine.dispose()
+
+    return {
+        "profile": profile,
+        "reads_per_s": counts["reads"] / seconds,
+        "writes_per_s": counts["writes"] / seconds,
+        "errors": counts["errors"],
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--readers", type=int, default=8)
+    parser.add_argument("--writers", type=int, default=2)
+    parser.add_argument("--seconds", type=float, default=5.0)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        for profile in ("default", "tuned"):
+            result = run_profile(
+                profile, os.path.join(tmp, f"{profile}.db"),
+                args.readers, args.writers, args.seconds
+            )
+            print(
+                f"{result['profile']:>8}: {result['reads_per_s']:8.0f} reads/s  "
+                f"{result['writes_per_s']:8.0f} writes/s  {result['errors']} lock errors"
+            )
+
+
+if __name__ == "__main__":
+    main()
@@ -5,7 +5,7 @@ from fastapi.testclient import TestClient
 from sqlalchemy import create_engine
 from sqlalchemy.orm import sessionmaker
 from app.main import app
-from app.database import Base, get_db
+from app.database import Base, get_db, get_read_db
 from app.models import User
 from app.auth.utils import hash_password
 
@@ -44,6 +44,7 @@ def client(test_db):
             pass
 
     app.dependency_overrides[get_db] = override_get_db
+    app.dependency_overrides[get_read_db] = override_get_db
     # Mock the scheduler to prevent it from starting during tests
     with patch('app.scheduler.start_scheduler'), patch('app.scheduler.stop_scheduler'):
         yield TestClient(app)
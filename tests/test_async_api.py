@@ -0,0 +1,66 @@
+import pytest
+from fastapi import FastAPI, status
+from fastapi.testclient import TestClient
+from sqlalchemy.ext.asyncio import async_sessionmaker
+
+pytest.importorskip("aiosqlite")
+
+from app.async_database import create_async_sqlite_engine, get_async_db, get_async_read_db
+from app.auth.async_router import router as auth_router
+from app.orders.async_router import router as orders_router
+from app.database import Base, create_sqlite_engine
+
+
+@pytest.fixture
+def async_client(tmp_path):
+    """Client for an app wired with the async routers, on a throwaway file DB"""
+    db_path = tmp_path / "async.db"
+    sync_engine = create_sqlite_engine(f"sqlite:///{db_path}")
+    Base.metadata.create_all(bind=sync_engine)
+    sync_engine.dispose()
+
+    engine = create_async_sqlite_engine(f"sqlite+aiosqlite:///{db_path}")
+    SessionLocal = async_sessionmaker(engine, expire_on_commit=False)
+
+    async def override_get_db():
+        async with SessionLocal() as db:
+            yield db
+
+    app = FastAPI()
+    app.include_router(auth_router)
+    app.include_router(orders_router)
+    app.dependency_overrides[get_async_db] = override_get_db
+    app.dependency_overrides[get_async_read_db] = override_get_db
+
+    with TestClient(app) as client:
+        yield client
+
+
+def test_async_order_flow(async_client):
+    """Test register, login, create, list, get and cancel through the async routes"""
+    creds = {"name": "Async", "email": "async@example.com", "password": "asyncpass"}
+    assert async_client.post("/auth/register", json=creds).status_code == status.HTTP_201_CREATED
+    token = async_client.post("/auth/login", json=creds).json()["access_token"]
+    headers = {"Authorization": f"Bearer {token}"}
+
+    created = async_client.post(
+        "/orders/", headers=headers, json={"item_name": "Item", "quantity": 1, "price": 5.0}
+    )
+    assert created.status_code == status.HTTP_201_CREATED
+    order_id = created.json()["id"]
+
+    batch = async_client.post(
+        "/orders/batch",
+        headers=headers,
+        json={"orders": [{"item_name": "B", "quantity": 1, "price": 1.0}] * 3}
+    )
+    assert len(batch.json()) == 3
+
+    page = async_client.get("/orders/", headers=headers, params={"limit": 2})
+    assert len(page.json()) == 2
+    assert page.headers["X-Next-Cursor"] == str(page.json()[-1]["id"])
+
+    assert async_client.get(f"/orders/{order_id}", headers=headers).json()["id"] == order_id
+
+    cancelled = async_client.delete(f"/orders/{order_id}/cancel", headers=headers)
+    assert cancelled.json()["status"] == "cancelled"
@@ -0,0 +1,30 @@
+import pytest
+from sqlalchemy import text
+from sqlalchemy.exc import OperationalError
+from app.database import create_sqlite_engine
+
+
+def test_tuned_profile_enables_wal(tmp_path):
+    """Test that the tuned profile switches the DB file to WAL"""
+    engine = create_sqlite_engine(f"sqlite:///{tmp_path / 'wal.db'}", profile="tuned")
+    with engine.connect() as conn:
+        assert conn.execute(text("PRAGMA journal_mode")).scalar() == "wal"
+        assert conn.execute(text("PRAGMA foreign_keys")).scalar() == 1
+    engine.dispose()
+
+
+def test_read_engine_rejects_writes(tmp_path):
+    """Test that the read-only engine cannot write"""
+    url = f"sqlite:///{tmp_path / 'ro.db'}"
+    writer = create_sqlite_engine(url)
+    with writer.begin() as conn:
+        conn.execute(text("CREATE TABLE t (x INTEGER)"))
+
+    reader = create_sqlite_engine(url, read_only=True)
+    with reader.connect() as conn:
+        assert conn.execute(text("SELECT count(*) FROM t")).scalar() == 0
+        with pytest.raises(OperationalError):
+            conn.execute(text("INSERT INTO t VALUES (1)"))
+
+    writer.dispose()
+    reader.dispose()
@@ -0,0 +1,56 @@
+import pytest
+from datetime import datetime, timedelta
+from unittest.mock import patch
+from app.models import Order
+from app.jobs import order_processor
+from tests.conftest import TestingSessionLocal
+
+
+@pytest.fixture
+def job_db(test_db):
+    """Point the background jobs at the test database"""
+    with patch.object(order_processor, "SessionLocal", TestingSessionLocal):
+        yield test_db
+
+
+def add_orders(db, user, count, status, age_minutes):
+    stamp = datetime.utcnow() - timedelta(minutes=age_minutes)
+    db.add_all([
+        Order(
+            user_id=user.id, item_name=f"Item {i}", quantity=1, price=1.0,
+            status=status, created_at=stamp, updated_at=stamp
+        )
+        for i in range(count)
+    ])
+    db.commit()
+
+
+def count_status(db, status):
+    db.expire_all()
+    return db.query(Order).filter(Order.status == status).count()
+
+
+def test_process_pending_orders_in_chunks(job_db, test_user):
+    """Test that old pending orders move to processing across several chunks"""
+    add_orders(job_db, test_user, 5, "pending", age_minutes=5)
+    add_orders(job_db, test_user, 2, "pending", age_minutes=0)
+
+    with patch.object(order_processor, "JOB_CHUNK_SIZE", 2):
+        moved = order_processor.process_pending_orders()
+
+    assert moved == 5
+    assert count_status(job_db, "processing") == 5
+    # Fresh orders keep their cancel window
+    assert count_status(job_db, "pending") == 2
+
+
+def test_complete_processing_orders(job_db, test_user):
+    """Test that stale processing orders complete and cancelled ones are left alone"""
+    add_orders(job_db, test_user, 3, "processing", age_minutes=5)
+    add_orders(job_db, test_user, 1, "cancelled", age_minutes=5)
+
+    moved = order_processor.complete_processing_orders()
+
+    assert moved == 3
+    assert count_status(job_db, "completed") == 3
+    assert count_status(job_db, "cancelled") == 1
@@ -87,3 +87,75 @@ def test_cancel_order(client, auth_headers):
     response = client.delete(f"/orders/{order_id}/cancel", headers=auth_headers)
     assert response.status_code == status.HTTP_200_OK
     assert response.json()["status"] == "cancelled"
+
+
+def test_create_orders_batch(client, auth_headers):
+    """Test creating several orders in one request"""
+    items = [
+        {"item_name": f"Item {i}", "quantity": i + 1, "price": 5.0 * (i + 1)}
+        for i in range(5)
+    ]
+    response = client.post("/orders/batch", headers=auth_headers, json={"orders": items})
+    assert response.status_code == status.HTTP_201_CREATED
+    data = response.json()
+    assert [o["item_name"] for o in data] == [i["item_name"] for i in items]
+    assert all(o["status"] == "pending" for o in data)
+
+    listed = client.get("/orders/", headers=auth_headers).json()
+    assert len(listed) == 5
+
+
+def test_create_orders_batch_reports_bad_item(client, auth_headers):
+    """Test that one invalid item rejects the batch and points at its index"""
+    items = [
+        {"item_name": "Good", "quantity": 1, "price": 10.0},
+        {"item_name": "Bad", "quantity": 0, "price": 10.0},
+    ]
+    response = client.post("/orders/batch", headers=auth_headers, json={"orders": items})
+    assert response.status_code == status.HTTP_422_UNPROCESSABLE_ENTITY
+    locs = [err["loc"] for err in response.json()["detail"]]
+    assert ["body", "orders", 1, "quantity"] in locs
+
+    # Nothing from the batch should have been written
+    assert client.get("/orders/", headers=auth_headers).json() == []
+
+
+def test_get_my_orders_paginates_with_cursor(client, auth_headers):
+    """Test walking the order list page by page"""
+    items = [{"item_name": f"Item {i}", "quantity": 1, "price": 1.0} for i in range(5)]
+    client.post("/orders/batch", headers=auth_headers, json={"orders": items})
+
+    seen = []
+    params = {"limit": 2}
+    while True:
+        response = client.get("/orders/", headers=auth_headers, params=params)
+        assert response.status_code == status.HTTP_200_OK
+        page = response.json()
+        assert len(page) <= 2
+        seen.extend(o["item_name"] for o in page)
+        next_cursor = response.headers.get("X-Next-Cursor")
+        if next_cursor is None:
+            break
+        params["cursor"] = next_cursor
+
+    assert seen == [i["item_name"] for i in items]
+
+    newest_first = client.get("/orders/", headers=auth_headers, params={"sort": "desc"}).json()
+    assert [o["item_name"] for o in newest_first] == list(reversed(seen))
+
+
+def test_get_my_orders_filters_by_status(client, auth_headers):
+    """Test the status filter on the order list"""
+    for i in range(3):
+        client.post(
+            "/orders/",
+            headers=auth_headers,
+            json={"item_name": f"Item {i}", "quantity": 1, "price": 1.0}
+        )
+    client.delete("/orders/1/cancel", headers=auth_headers)
+
+    response = client.get("/orders/", headers=auth_headers, params={"status": "cancelled"})
+    assert [o["id"] for o in response.json()] == [1]
+
+    response = client.get("/orders/", headers=auth_headers, params={"limit": 500})
+    assert response.status_code == status.HTTP_422_UNPROCESSABLE_ENTITY